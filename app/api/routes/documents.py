@@ -8,7 +8,7 @@ from app.api.schemas import (
     ErrorResponse,
 )
 from app.core.document_processor import DocumentProcessor
-from app.core.vector_store import VectorStoreService
+from app.core.vector_store import get_vector_store_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -50,8 +50,8 @@ async def upload_document(
             )
 
         # Add to vector store
-        vector_store = VectorStoreService()
-        document_ids = vector_store.add_documents(chunks)
+        vector_store = get_vector_store_service()
+        document_ids = await vector_store.aadd_documents(chunks)
 
         logger.info(
             f"Successfully processed {file.filename}: "
@@ -87,7 +87,7 @@ async def get_collection_info() -> DocumentListResponse:
     logger.debug("Collection info requested")
 
     try:
-        vector_store = VectorStoreService()
+        vector_store = get_vector_store_service()
         info = vector_store.get_collection_info()
 
         return DocumentListResponse(
@@ -117,9 +117,12 @@ async def delete_collection() -> dict:
     logger.warning("Collection deletion requested")
 
     try:
-        vector_store = VectorStoreService()
+        vector_store = get_vector_store_service()
         vector_store.delete_collection()
 
+        # Drop cached services so the next request recreates the collection
+        get_vector_store_service.cache_clear()
+
         return {"message": "Collection deleted successfully"}
     except Exception as e:
         logger.error(f"Error deleting collection: {e}")
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException
 
 from app import __version__
 from app.api.schemas import HealthResponse, ReadinessResponse
-from app.core.vector_store import VectorStoreService
+from app.core.vector_store import get_vector_store_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,8 +41,8 @@ async def readiness_check() -> ReadinessResponse:
 
     try:
         # Check Qdrant connection
-        vector_store = VectorStoreService()
-        is_healthy = vector_store.health_check()
+        vector_store = get_vector_store_service()
+        is_healthy = await vector_store.ahealth_check()
 
         if not is_healthy:
             raise HTTPException(
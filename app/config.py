@@ -3,6 +3,7 @@
 from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from qdrant_client.http.models import PayloadSchemaType
 
 
 class Settings(BaseSettings):
@@ -21,14 +22,31 @@ class Settings(BaseSettings):
     # Qdrant Configuration (supports both Cloud and Docker)
     qdrant_url: str
     qdrant_api_key: str | None = None  # Optional for local Docker deployments
+    qdrant_prefer_grpc: bool = False  # Use gRPC (requires the gRPC port to be reachable)
+    qdrant_grpc_port: int = 6334
+    qdrant_pool_size: int = 100  # Connections shared by concurrent requests
 
     # Collection Settings
     collection_name: str = "rag_documents"
+    collection_info_ttl_seconds: float = 5.0  # How long fetched collection info is reused
+
+    # Collection Creation Settings (only applied when the collection is created)
+    qdrant_scalar_quantization: bool = True  # Keep an int8 copy of vectors for search
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    qdrant_segments: int = 0  # 0 lets Qdrant pick based on CPU count
+    payload_indexes: dict[str, PayloadSchemaType] = {"metadata.source": PayloadSchemaType.KEYWORD}
 
     # Document Processing Settings
     chunk_size: int = 1000
     chunk_overlap: int = 200
 
+    # Ingestion Settings
+    embed_batch_size: int = 96  # Texts per embeddings API call
+    qdrant_upload_batch_size: int = 64  # Points per Qdrant upload request
+    qdrant_upload_parallel: int = 1  # Upload worker processes for multi-batch ingests
+    compress_page_content: bool = False  # Store chunk text zstd-compressed in Qdrant
+
     # Model Configuration
     embedding_model: str = "text-embedding-3-small"
     llm_model: str = "gpt-4o-mini"
@@ -37,6 +55,15 @@ class Settings(BaseSettings):
     # Retrieval Settings
     retrieval_k: int = 4
 
+    # Search Cache Settings
+    search_cache_size: int = 256  # Exact-match entries kept per service
+    search_cache_ttl_seconds: float = 300.0
+    semantic_cache_size: int = 64  # Recent query embeddings compared on a miss
+    semantic_cache_threshold: float = 0.95  # Cosine similarity needed for a hit
+
+    # Health Check Settings
+    health_ttl_ms: int = 1000  # How long a successful Qdrant health check is reused
+
     # Logging
     log_level: str = "INFO"
 
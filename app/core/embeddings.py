@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 
 from app.config import get_settings
@@ -29,6 +30,26 @@ def get_embeddings() -> OpenAIEmbeddings:
     return embeddings
 
 
+@lru_cache(maxsize=10000)
+def cached_embed_query(text: str) -> np.ndarray:
+    """Embed a query with the configured model, reusing vectors for repeated queries.
+
+    Vectors are cached as packed float32 arrays (the precision Qdrant stores)
+    rather than lists of Python floats, which are about 8x larger. The
+    embeddings model is fixed per process, so the query text is the only key.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Read-only float32 embedding vector
+    """
+    logger.debug("Embedding cache miss for query: %.50s...", text)
+    vector = np.asarray(get_embeddings().embed_query(text), dtype=np.float32)
+    vector.flags.writeable = False
+    return vector
+
+
 class EmbeddingService:
     """Service for generating embeddings."""
 
@@ -47,7 +68,7 @@ class EmbeddingService:
         Returns:
             Embedding vector as list of floats
         """
-        logger.debug(f"Generating embedding for query: {text[:50]}...")
+        logger.debug("Generating embedding for query: %.50s...", text)
         return self.embeddings.embed_query(text)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
@@ -59,5 +80,5 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        logger.debug(f"Generating embeddings for {len(texts)} documents")
+        logger.debug("Generating embeddings for %d documents", len(texts))
         return self.embeddings.embed_documents(texts)
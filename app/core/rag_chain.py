@@ -7,7 +7,7 @@ from langchain_core.runnables import RunnablePassthrough
 from langchain_openai import ChatOpenAI
 
 from app.config import get_settings
-from app.core.vector_store import VectorStoreService
+from app.core.vector_store import VectorStoreService, get_vector_store_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -50,7 +50,7 @@ class RAGChain:
         Args:
             vector_store_service: Optional VectorStoreService instance
         """
-        self.vector_store = vector_store_service or VectorStoreService()
+        self.vector_store = vector_store_service or get_vector_store_service()
         self.retriever = self.vector_store.get_retriever()
 
         # Initialize evaluator (lazy load)
@@ -1,17 +1,38 @@
 """Vector store module for Qdrant operations."""
 
+import asyncio
+import base64
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Sequence
 from functools import lru_cache
-from typing import Any
-from uuid import uuid4
+from typing import Any, Final
+from uuid import UUID
 
+import grpc
+import numpy as np
+import zstandard
 from langchain_core.documents import Document
-from langchain_qdrant import QdrantVectorStore
-from qdrant_client import QdrantClient
+from langchain_core.retrievers import BaseRetriever
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    CollectionInfo,
+    Distance,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+    PointStruct,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
 
 from app.config import get_settings
-from app.core.embeddings import get_embeddings
+from app.core.embeddings import cached_embed_query, get_embeddings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,25 +45,69 @@ EMBEDDING_DIMENSIONS = {
     "text-embedding-ada-002": 1536,
 }
 
+# Payload keys matching LangChain's QdrantVectorStore layout, so existing collections stay readable
+CONTENT_PAYLOAD_KEY = "page_content"
+METADATA_PAYLOAD_KEY = "metadata"
 
-def get_embedding_dimension() -> int:
-    """Get embedding dimension based on configured model.
+# Payload key for zstd-compressed, base64-encoded content (see compress_page_content)
+COMPRESSED_CONTENT_PAYLOAD_KEY = "page_content_zstd"
+
+# zstd compressor/decompressor objects are not thread-safe, so keep one per thread
+_zstd_local = threading.local()
+
+# Embedding dimension for the configured model, fixed for the life of the process
+EMBEDDING_DIMENSION: Final[int] = EMBEDDING_DIMENSIONS.get(settings.embedding_model, 1536)
+
+if settings.embedding_model not in EMBEDDING_DIMENSIONS:
+    logger.warning(
+        f"Unknown embedding model '{settings.embedding_model}', defaulting to 1536 dimensions. "
+        f"Known models: {list(EMBEDDING_DIMENSIONS.keys())}"
+    )
+
+
+def _normalize(vector: np.ndarray | Sequence[float]) -> np.ndarray:
+    """Convert a vector to a unit-length float32 array for cosine comparisons.
+
+    Args:
+        vector: Embedding vector
 
     Returns:
-        Embedding dimension for the configured model
+        Normalized numpy array
     """
-    model = settings.embedding_model
-    dimension = EMBEDDING_DIMENSIONS.get(model)
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
 
-    if dimension is None:
-        logger.warning(
-            f"Unknown embedding model '{model}', defaulting to 1536 dimensions. "
-            f"Known models: {list(EMBEDDING_DIMENSIONS.keys())}"
-        )
-        return 1536
 
-    logger.debug(f"Using {dimension} dimensions for model '{model}'")
-    return dimension
+def _generate_ids(count: int) -> list[str]:
+    """Generate random UUID4 point IDs from a single urandom call.
+
+    Args:
+        count: Number of IDs to generate
+
+    Returns:
+        List of UUIDs in the hyphenated form Qdrant returns as point IDs
+    """
+    random_bytes = os.urandom(16 * count)
+    return [str(UUID(bytes=random_bytes[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _get_client_kwargs() -> dict[str, Any]:
+    """Build connection arguments shared by the sync and async Qdrant clients.
+
+    Returns:
+        Keyword arguments for QdrantClient / AsyncQdrantClient
+    """
+    # For local Docker deployment, api_key is optional
+    client_kwargs: dict[str, Any] = {
+        "url": settings.qdrant_url,
+        "prefer_grpc": settings.qdrant_prefer_grpc,
+        "grpc_port": settings.qdrant_grpc_port,
+        "pool_size": settings.qdrant_pool_size,
+    }
+    if settings.qdrant_api_key:
+        client_kwargs["api_key"] = settings.qdrant_api_key
+    return client_kwargs
 
 
 @lru_cache
@@ -54,20 +119,102 @@ def get_qdrant_client() -> QdrantClient:
     """
     logger.info(f"Connecting to Qdrant at: {settings.qdrant_url}")
 
-    # For local Docker deployment, api_key is optional
-    client_kwargs = {"url": settings.qdrant_url}
     if settings.qdrant_api_key:
-        client_kwargs["api_key"] = settings.qdrant_api_key
         logger.info("Using Qdrant with API key authentication")
     else:
         logger.info("Using Qdrant without authentication (local Docker mode)")
 
-    client = QdrantClient(**client_kwargs)
+    if settings.qdrant_prefer_grpc:
+        logger.info(f"Using Qdrant gRPC on port {settings.qdrant_grpc_port}")
+
+    client = QdrantClient(**_get_client_kwargs())
 
     logger.info("Qdrant client connected successfully")
     return client
 
 
+@lru_cache
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """Get cached async Qdrant client instance.
+
+    Returns:
+        Configured AsyncQdrantClient instance
+    """
+    logger.info(f"Creating async Qdrant client for: {settings.qdrant_url}")
+    return AsyncQdrantClient(**_get_client_kwargs())
+
+
+def _compress_text(text: str) -> str:
+    """Compress text with zstd for storage in a JSON payload.
+
+    Args:
+        text: Text to compress
+
+    Returns:
+        Base64-encoded zstd frame
+    """
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return base64.b64encode(compressor.compress(text.encode("utf-8"))).decode("ascii")
+
+
+def _decompress_text(data: str) -> str:
+    """Decompress text stored by _compress_text.
+
+    Args:
+        data: Base64-encoded zstd frame
+
+    Returns:
+        Original text
+    """
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(base64.b64decode(data)).decode("utf-8")
+
+
+def _document_from_point(point: Any, collection_name: str) -> Document:
+    """Convert a Qdrant point to a Document, matching LangChain's layout.
+
+    Args:
+        point: Scored point returned by a Qdrant query
+        collection_name: Collection the point was read from
+
+    Returns:
+        Document with the point's content and metadata
+    """
+    metadata = point.payload.get(METADATA_PAYLOAD_KEY) or {}
+    metadata["_id"] = point.id
+    metadata["_collection_name"] = collection_name
+
+    # Points may hold plain or compressed content depending on when they were stored
+    compressed = point.payload.get(COMPRESSED_CONTENT_PAYLOAD_KEY)
+    if compressed is not None:
+        page_content = _decompress_text(compressed)
+    else:
+        page_content = point.payload.get(CONTENT_PAYLOAD_KEY, "")
+
+    return Document(page_content=page_content, metadata=metadata)
+
+
+class VectorStoreServiceRetriever(BaseRetriever):
+    """LangChain retriever backed by VectorStoreService search.
+
+    Goes through the service so retrieval shares its caches and reads
+    compressed payloads.
+    """
+
+    service: Any
+    k: int
+
+    def _get_relevant_documents(self, query: str) -> list[Document]:
+        return self.service.search(query, k=self.k)
+
+    async def _aget_relevant_documents(self, query: str) -> list[Document]:
+        return await self.service.asearch(query, k=self.k)
+
+
 class VectorStoreService:
     """Service for managing vector store operations."""
 
@@ -79,77 +226,171 @@ class VectorStoreService:
         """
         self.collection_name = collection_name or settings.collection_name
         self.client = get_qdrant_client()
+        self.aclient = get_async_qdrant_client()
         self.embeddings = get_embeddings()
 
-        # Ensure collection exists
-        self._ensure_collection()
+        # Fetch collection config once, creating the collection if needed
+        self._collection_info: tuple[float, CollectionInfo] | None = None
+        info = self._probe_collection()
+        if info is None:
+            self._create_collection()
+            info = self._probe_collection()
+        else:
+            logger.info(
+                f"Collection '{self.collection_name}' exists with {info.points_count} points"
+            )
 
-        # Initialize LangChain Qdrant vector store
-        # Check if collection exists and get its vector name
-        vector_name = self._get_vector_name()
+        self.vector_name = self._resolve_vector_name(info)
 
-        self.vector_store = QdrantVectorStore(
-            client=self.client,
-            collection_name=self.collection_name,
-            embedding=self.embeddings,
-            vector_name=vector_name,
+        # Search result caches: exact query match, then embedding similarity
+        self._exact_cache: OrderedDict[tuple[str, int], tuple[float, list[Document]]] = (
+            OrderedDict()
+        )
+        self._semantic_cache: deque[tuple[np.ndarray, int, float, list[Document]]] = deque(
+            maxlen=settings.semantic_cache_size
         )
+        # The service is shared per process and searched from executor threads
+        self._cache_lock = threading.Lock()
+
+        # Last health check result as (monotonic time, healthy)
+        self._last_health: tuple[float, bool] = (0.0, False)
+        self._health_lock = threading.Lock()
 
         logger.info(f"VectorStoreService initialized for collection: {self.collection_name}")
 
-    def _ensure_collection(self) -> None:
-        """Ensure the collection exists, create if not."""
+    def _probe_collection(self) -> CollectionInfo | None:
+        """Fetch collection info with a single request, treating not-found as missing.
+
+        Used on startup, where the collection almost always exists, so the
+        existence check is folded into ``get_collection`` instead of paying for
+        a separate ``collection_exists`` round-trip.
+
+        Returns:
+            Collection info, or None if the collection does not exist
+        """
         try:
-            collection_info = self.client.get_collection(self.collection_name)
-            logger.info(
-                f"Collection '{self.collection_name}' exists with "
-                f"{collection_info.points_count} points"
-            )
-        except UnexpectedResponse:
-            embedding_dim = get_embedding_dimension()
-            logger.info(
-                f"Creating collection: {self.collection_name} " f"with {embedding_dim} dimensions"
+            info = self.client.get_collection(self.collection_name)
+        except UnexpectedResponse as e:
+            if e.status_code != 404:
+                raise
+            return None
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.NOT_FOUND:
+                raise
+            return None
+
+        self._collection_info = (time.monotonic(), info)
+        return info
+
+    def _fetch_collection_or_none(self) -> CollectionInfo | None:
+        """Fetch collection info from Qdrant and cache it on the instance.
+
+        Returns:
+            Collection info, or None if the collection does not exist
+        """
+        # Info lookups can run after the collection was deleted, so check for it
+        # explicitly rather than relying on get_collection's error shape
+        if not self.client.collection_exists(self.collection_name):
+            self._collection_info = None
+            return None
+
+        info = self.client.get_collection(self.collection_name)
+        self._collection_info = (time.monotonic(), info)
+        return info
+
+    def _get_cached_collection_info(self) -> CollectionInfo | None:
+        """Get collection info, reusing the cached copy while it is fresh.
+
+        Returns:
+            Collection info, or None if the collection does not exist
+        """
+        if self._collection_info is not None:
+            fetched_at, info = self._collection_info
+            if time.monotonic() - fetched_at < settings.collection_info_ttl_seconds:
+                return info
+
+        return self._fetch_collection_or_none()
+
+    def _create_collection(self) -> None:
+        """Create the collection for the configured embedding model."""
+        logger.info(
+            f"Creating collection: {self.collection_name} with {EMBEDDING_DIMENSION} dimensions"
+        )
+
+        # int8 scalar quantization keeps a 4x smaller copy of vectors in RAM for search
+        quantization_config = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
             )
-            self.client.create_collection(
+            if settings.qdrant_scalar_quantization
+            else None
+        )
+
+        self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=EMBEDDING_DIMENSION,
+                distance=Distance.COSINE,
+            ),
+            hnsw_config=HnswConfigDiff(
+                m=settings.hnsw_m,
+                ef_construct=settings.hnsw_ef_construct,
+                on_disk=False,
+            ),
+            optimizers_config=OptimizersConfigDiff(
+                default_segment_number=settings.qdrant_segments,
+            ),
+            quantization_config=quantization_config,
+            on_disk_payload=True,
+        )
+
+        # Index filterable payload fields so filtered searches avoid a full scan
+        for field_name, field_schema in settings.payload_indexes.items():
+            self.client.create_payload_index(
                 collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=embedding_dim,
-                    distance=Distance.COSINE,
-                ),
+                field_name=field_name,
+                field_schema=field_schema,
             )
-            logger.info(f"Collection '{self.collection_name}' created successfully")
+            logger.info(f"Created {field_schema} payload index on '{field_name}'")
+
+        logger.info(f"Collection '{self.collection_name}' created successfully")
 
-    def _get_vector_name(self) -> str:
-        """Get the vector field name from existing collection or use default.
+    @staticmethod
+    def _resolve_vector_name(info: CollectionInfo | None) -> str:
+        """Get the vector field name from collection info or use default.
+
+        Args:
+            info: Collection info fetched from Qdrant
 
         Returns:
             Vector field name to use
         """
-        try:
-            collection_info = self.client.get_collection(self.collection_name)
-            vectors_config = collection_info.config.params.vectors
-
-            # Handle named vectors (dict-like structure)
-            if isinstance(vectors_config, dict):
-                # Named vectors - get the first vector name
-                vector_names = list(vectors_config.keys())
-                if vector_names:
-                    vector_name = vector_names[0]
-                    logger.info(f"Using existing vector field: '{vector_name}'")
-                    return vector_name
-
-            # Single default vector (VectorParams object - unnamed)
-            logger.info("Using default unnamed vector field")
-            return ""
+        vectors_config = info.config.params.vectors if info is not None else None
 
-        except Exception as e:
-            # Collection doesn't exist or error reading config, use default
-            logger.warning(f"Could not detect vector name, using default: {e}")
-            return ""
+        # Handle named vectors (mapping of name -> VectorParams)
+        if hasattr(vectors_config, "keys"):
+            # Named vectors - take the first name without materializing the keys
+            vector_name = next(iter(vectors_config), "")
+            if vector_name:
+                logger.info(f"Using existing vector field: '{vector_name}'")
+                return vector_name
+
+        # Single default vector (VectorParams object - unnamed)
+        logger.info("Using default unnamed vector field")
+        return ""
 
     def add_documents(self, documents: list[Document]) -> list[str]:
         """Add documents to the vector store.
 
+        Texts are embedded in batches of ``settings.embed_batch_size`` and the
+        resulting points are streamed to Qdrant with ``upload_points``, which
+        sends them in batches (in parallel worker processes for large ingests when
+        ``settings.qdrant_upload_parallel`` > 1) without waiting for indexing.
+
         Args:
             documents: List of Document objects to add
 
@@ -160,17 +401,156 @@ class VectorStoreService:
             logger.warning("No documents to add")
             return []
 
-        logger.info(f"Adding {len(documents)} documents to collection")
+        logger.info("Adding %d documents to collection", len(documents))
 
         # Generate unique IDs for each document
-        ids = [str(uuid4()) for _ in documents]
+        ids = _generate_ids(len(documents))
+
+        self._upload_points(self.client, self._iter_points(ids, documents), len(documents))
 
-        # Add to vector store
-        self.vector_store.add_documents(documents, ids=ids)
+        self.clear_search_cache()
+        self._collection_info = None
 
-        logger.info(f"Successfully added {len(documents)} documents")
+        logger.info("Successfully added %d documents", len(documents))
         return ids
 
+    async def aadd_documents(self, documents: list[Document]) -> list[str]:
+        """Add documents to the vector store without blocking the event loop.
+
+        Texts are embedded with the async embeddings API, then the points go
+        through the same ``upload_points`` path as ``add_documents``, run in a
+        worker thread because the client's uploader is blocking. Unlike bulk
+        ingest, this waits for Qdrant to apply the points, so a search right
+        after an upload sees (and caches) the new documents.
+
+        Args:
+            documents: List of Document objects to add
+
+        Returns:
+            List of document IDs
+        """
+        if not documents:
+            logger.warning("No documents to add")
+            return []
+
+        logger.info("Adding %d documents to collection", len(documents))
+
+        ids = _generate_ids(len(documents))
+
+        points: list[PointStruct] = []
+        batch_size = settings.embed_batch_size
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start : start + batch_size]
+            vectors = await self.embeddings.aembed_documents([doc.page_content for doc in batch])
+            points.extend(self._build_points(ids[start : start + batch_size], batch, vectors))
+
+        await asyncio.to_thread(
+            self._upload_points, self.aclient, points, len(documents), wait=True
+        )
+
+        self.clear_search_cache()
+        self._collection_info = None
+
+        logger.info("Successfully added %d documents", len(documents))
+        return ids
+
+    def _upload_points(
+        self,
+        client: QdrantClient | AsyncQdrantClient,
+        points: Iterable[PointStruct],
+        count: int,
+        wait: bool = False,
+    ) -> None:
+        """Stream points to Qdrant in batches.
+
+        Args:
+            client: Qdrant client whose (blocking) ``upload_points`` to use
+            points: Points to upload
+            count: Number of points, used to decide on parallel workers
+            wait: Whether each batch waits for Qdrant to apply it
+        """
+        # Worker processes only pay off once there is more than one upload batch
+        upload_batch_size = settings.qdrant_upload_batch_size
+        parallel = settings.qdrant_upload_parallel if count > upload_batch_size else 1
+
+        client.upload_points(
+            collection_name=self.collection_name,
+            points=points,
+            batch_size=upload_batch_size,
+            parallel=parallel,
+            wait=wait,
+            max_retries=3,
+        )
+
+    def _iter_points(
+        self,
+        ids: list[str],
+        documents: list[Document],
+    ) -> Iterator[PointStruct]:
+        """Embed documents batch by batch and yield them as Qdrant points.
+
+        Args:
+            ids: Point IDs
+            documents: Documents to store
+
+        Yields:
+            PointStruct objects ready to upload
+        """
+        batch_size = settings.embed_batch_size
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start : start + batch_size]
+            vectors = self.embeddings.embed_documents([doc.page_content for doc in batch])
+            yield from self._build_points(ids[start : start + batch_size], batch, vectors)
+
+    def _build_points(
+        self,
+        ids: list[str],
+        documents: list[Document],
+        vectors: list[list[float]],
+    ) -> list[PointStruct]:
+        """Build Qdrant points using LangChain's payload layout.
+
+        With ``settings.compress_page_content`` enabled, content is stored
+        zstd-compressed under a separate key instead of as plain text.
+
+        Args:
+            ids: Point IDs
+            documents: Documents to store
+            vectors: Embedding for each document
+
+        Returns:
+            List of PointStruct objects ready to upsert
+        """
+        return [
+            PointStruct(
+                id=point_id,
+                vector={self.vector_name: vector},
+                payload=self._build_payload(doc),
+            )
+            for point_id, doc, vector in zip(ids, documents, vectors, strict=True)
+        ]
+
+    @staticmethod
+    def _build_payload(document: Document) -> dict[str, Any]:
+        """Build the payload stored alongside a document's vector.
+
+        Args:
+            document: Document to store
+
+        Returns:
+            Payload dictionary
+        """
+        if settings.compress_page_content:
+            return {
+                COMPRESSED_CONTENT_PAYLOAD_KEY: _compress_text(document.page_content),
+                METADATA_PAYLOAD_KEY: document.metadata,
+            }
+
+        return {
+            CONTENT_PAYLOAD_KEY: document.page_content,
+            METADATA_PAYLOAD_KEY: document.metadata,
+        }
+
     def search(
         self,
         query: str,
@@ -178,6 +558,10 @@ class VectorStoreService:
     ) -> list[Document]:
         """Search for similar documents.
 
+        Results are cached per service: an identical query is served from an
+        exact-match cache, and a near-identical one (by embedding similarity)
+        from the semantic cache, skipping the Qdrant round-trip.
+
         Args:
             query: Search query
             k: Number of results to return (default from settings)
@@ -186,12 +570,289 @@ class VectorStoreService:
             List of similar Document objects
         """
         k = k or settings.retrieval_k
-        logger.debug(f"Searching for: {query[:50]}... (k={k})")
+        logger.debug("Searching for: %.50s... (k=%d)", query, k)
 
-        results = self.vector_store.similarity_search(query, k=k)
+        cached = self._get_exact_cached(query, k)
+        if cached is not None:
+            logger.debug("Search served from exact-match cache")
+            return cached
 
-        logger.debug(f"Found {len(results)} results")
-        return results
+        embedding = self.embed_query(query)
+        normalized = _normalize(embedding)
+
+        cached = self._get_semantic_cached(normalized, k)
+        if cached is None:
+            results = self.search_by_vector(embedding, k=k)
+            self._put_semantic_cached(normalized, k, results)
+        else:
+            logger.debug("Search served from semantic cache")
+            results = cached
+
+        self._put_exact_cached(query, k, results)
+
+        logger.debug("Found %d results", len(results))
+        return list(results)
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the vector for repeated queries.
+
+        Callers that need the query vector (e.g. for reranking) should get it
+        here and pass it to search_by_vector() rather than embedding twice.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Read-only float32 query embedding
+        """
+        return cached_embed_query(query)
+
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """Embed a search query without blocking the event loop.
+
+        Shares the per-process embedding cache with embed_query(); misses are
+        embedded in a worker thread.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Read-only float32 query embedding
+        """
+        return await asyncio.to_thread(cached_embed_query, query)
+
+    def search_by_vector(
+        self,
+        embedding: np.ndarray | Sequence[float],
+        k: int | None = None,
+    ) -> list[Document]:
+        """Search for documents similar to a precomputed query embedding.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return (default from settings)
+
+        Returns:
+            List of similar Document objects
+        """
+        k = k or settings.retrieval_k
+        return [doc for doc, _ in self._query_by_vector(embedding, k)]
+
+    def _query_by_vector(
+        self,
+        embedding: np.ndarray | Sequence[float],
+        k: int,
+    ) -> list[tuple[Document, float]]:
+        """Query the collection by vector directly through the Qdrant client.
+
+        Skips LangChain's search wrapper, which re-validates the collection
+        config (an extra get_collection request) on every call.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+
+        Returns:
+            List of (Document, score) tuples
+        """
+        # qdrant-client accepts float32 arrays directly; no-op for cached query vectors
+        response = self.client.query_points(
+            collection_name=self.collection_name,
+            query=np.asarray(embedding, dtype=np.float32),
+            using=self.vector_name or None,
+            limit=k,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return [
+            (_document_from_point(point, self.collection_name), point.score)
+            for point in response.points
+        ]
+
+    def search_many(
+        self,
+        queries: list[str],
+        k: int | None = None,
+    ) -> list[list[Document]]:
+        """Search for similar documents for several queries at once.
+
+        All queries are embedded in one embeddings call and sent to Qdrant as a
+        single batch request.
+
+        Args:
+            queries: Search queries
+            k: Number of results to return per query (default from settings)
+
+        Returns:
+            List of similar Document objects for each query, in query order
+        """
+        if not queries:
+            return []
+
+        k = k or settings.retrieval_k
+        logger.debug("Batch searching %d queries (k=%d)", len(queries), k)
+
+        embeddings = self.embeddings.embed_documents(queries)
+        requests = [
+            QueryRequest(
+                query=embedding,
+                using=self.vector_name or None,
+                limit=k,
+                with_payload=True,
+            )
+            for embedding in embeddings
+        ]
+
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=requests,
+        )
+
+        return [
+            [_document_from_point(point, self.collection_name) for point in response.points]
+            for response in responses
+        ]
+
+    async def asearch(
+        self,
+        query: str,
+        k: int | None = None,
+    ) -> list[Document]:
+        """Search for similar documents without blocking the event loop.
+
+        Shares the search caches with search().
+
+        Args:
+            query: Search query
+            k: Number of results to return (default from settings)
+
+        Returns:
+            List of similar Document objects
+        """
+        k = k or settings.retrieval_k
+        logger.debug("Searching async for: %.50s... (k=%d)", query, k)
+
+        cached = self._get_exact_cached(query, k)
+        if cached is not None:
+            logger.debug("Search served from exact-match cache")
+            return cached
+
+        embedding = await self.aembed_query(query)
+        normalized = _normalize(embedding)
+
+        cached = self._get_semantic_cached(normalized, k)
+        if cached is None:
+            results = [doc for doc, _ in await self._aquery_by_vector(embedding, k)]
+            self._put_semantic_cached(normalized, k, results)
+        else:
+            logger.debug("Search served from semantic cache")
+            results = cached
+
+        self._put_exact_cached(query, k, results)
+
+        logger.debug("Found %d results", len(results))
+        return list(results)
+
+    async def _aquery_by_vector(
+        self,
+        embedding: np.ndarray | Sequence[float],
+        k: int,
+    ) -> list[tuple[Document, float]]:
+        """Query the collection by vector using the async client.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+
+        Returns:
+            List of (Document, score) tuples
+        """
+        response = await self.aclient.query_points(
+            collection_name=self.collection_name,
+            query=np.asarray(embedding, dtype=np.float32),
+            using=self.vector_name or None,
+            limit=k,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return [
+            (_document_from_point(point, self.collection_name), point.score)
+            for point in response.points
+        ]
+
+    def _get_exact_cached(self, query: str, k: int) -> list[Document] | None:
+        """Look up results for an identical query, evicting expired entries.
+
+        Args:
+            query: Search query
+            k: Number of results requested
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        key = (query, k)
+        with self._cache_lock:
+            entry = self._exact_cache.get(key)
+            if entry is None:
+                return None
+
+            created, results = entry
+            if time.monotonic() - created > settings.search_cache_ttl_seconds:
+                self._exact_cache.pop(key, None)
+                return None
+
+            self._exact_cache.move_to_end(key)
+        return list(results)
+
+    def _put_exact_cached(self, query: str, k: int, results: list[Document]) -> None:
+        """Store results for a query, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._exact_cache[(query, k)] = (time.monotonic(), results)
+            self._exact_cache.move_to_end((query, k))
+            while len(self._exact_cache) > settings.search_cache_size:
+                self._exact_cache.popitem(last=False)
+
+    def _put_semantic_cached(self, embedding: np.ndarray, k: int, results: list[Document]) -> None:
+        """Store results under a query embedding, dropping the oldest entry when full."""
+        with self._cache_lock:
+            self._semantic_cache.append((embedding, k, time.monotonic(), results))
+
+    def _get_semantic_cached(self, embedding: np.ndarray, k: int) -> list[Document] | None:
+        """Look up results for a query whose embedding is close to a recent one.
+
+        Args:
+            embedding: Unit-normalized query embedding
+            k: Number of results requested
+
+        Returns:
+            Cached results of the most similar recent query, or None on a miss
+        """
+        # Snapshot under the lock; the similarity math runs outside it
+        with self._cache_lock:
+            snapshot = list(self._semantic_cache)
+
+        now = time.monotonic()
+        entries = [
+            (cached_embedding, results)
+            for cached_embedding, cached_k, created, results in snapshot
+            if cached_k == k and now - created <= settings.search_cache_ttl_seconds
+        ]
+        if not entries:
+            return None
+
+        # Cosine similarity against every recent query in one matrix-vector product
+        similarities = np.stack([cached_embedding for cached_embedding, _ in entries]) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < settings.semantic_cache_threshold:
+            return None
+
+        return entries[best][1]
+
+    def clear_search_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._cache_lock:
+            self._exact_cache.clear()
+            self._semantic_cache.clear()
 
     def search_with_scores(
         self,
@@ -208,11 +869,35 @@ class VectorStoreService:
             List of (Document, score) tuples
         """
         k = k or settings.retrieval_k
-        logger.debug(f"Searching with scores for: {query[:50]}... (k={k})")
+        logger.debug("Searching with scores for: %.50s... (k=%d)", query, k)
 
-        results = self.vector_store.similarity_search_with_score(query, k=k)
+        embedding = self.embed_query(query)
+        results = self._query_by_vector(embedding, k)
 
-        logger.debug(f"Found {len(results)} results with scores")
+        logger.debug("Found %d results with scores", len(results))
+        return results
+
+    async def asearch_with_scores(
+        self,
+        query: str,
+        k: int | None = None,
+    ) -> list[tuple[Document, float]]:
+        """Search for similar documents with scores without blocking the event loop.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+
+        Returns:
+            List of (Document, score) tuples
+        """
+        k = k or settings.retrieval_k
+        logger.debug("Searching async with scores for: %.50s... (k=%d)", query, k)
+
+        embedding = await self.aembed_query(query)
+        results = await self._aquery_by_vector(embedding, k)
+
+        logger.debug("Found %d results with scores", len(results))
         return results
 
     def get_retriever(self, k: int | None = None) -> Any:
@@ -226,15 +911,14 @@ class VectorStoreService:
         """
         k = k or settings.retrieval_k
 
-        return self.vector_store.as_retriever(
-            search_type="similarity",
-            search_kwargs={"k": k},
-        )
+        return VectorStoreServiceRetriever(service=self, k=k)
 
     def delete_collection(self) -> None:
         """Delete the entire collection."""
         logger.warning(f"Deleting collection: {self.collection_name}")
         self.client.delete_collection(self.collection_name)
+        self.clear_search_cache()
+        self._collection_info = None
         logger.info(f"Collection '{self.collection_name}' deleted")
 
     def get_collection_info(self) -> dict:
@@ -243,15 +927,8 @@ class VectorStoreService:
         Returns:
             Dictionary with collection statistics
         """
-        try:
-            info = self.client.get_collection(self.collection_name)
-            return {
-                "name": self.collection_name,
-                "points_count": info.points_count,
-                "indexed_vectors_count": info.indexed_vectors_count,
-                "status": info.status.value,
-            }
-        except UnexpectedResponse:
+        info = self._get_cached_collection_info()
+        if info is None:
             return {
                 "name": self.collection_name,
                 "points_count": 0,
@@ -259,15 +936,76 @@ class VectorStoreService:
                 "status": "not_found",
             }
 
+        return {
+            "name": self.collection_name,
+            "points_count": info.points_count,
+            "indexed_vectors_count": info.indexed_vectors_count,
+            "status": info.status.value,
+        }
+
     def health_check(self) -> bool:
         """Check if vector store is healthy.
 
+        A successful check is reused for ``settings.health_ttl_ms`` so frequent
+        readiness probes don't each cost a Qdrant request.
+
         Returns:
             True if healthy, False otherwise
         """
+        if self._is_recently_healthy():
+            return True
+
         try:
             self.client.get_collections()
+            healthy = True
+        except Exception as e:
+            logger.error(f"Vector store health check failed: {e}")
+            healthy = False
+
+        self._record_health(healthy)
+        return healthy
+
+    async def ahealth_check(self) -> bool:
+        """Check if vector store is healthy without blocking the event loop.
+
+        Shares the cached result with health_check().
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        if self._is_recently_healthy():
             return True
+
+        try:
+            await self.aclient.get_collections()
+            healthy = True
         except Exception as e:
             logger.error(f"Vector store health check failed: {e}")
-            return False
+            healthy = False
+
+        self._record_health(healthy)
+        return healthy
+
+    def _is_recently_healthy(self) -> bool:
+        """Check whether the last health check succeeded within the TTL."""
+        with self._health_lock:
+            checked_at, healthy = self._last_health
+        return healthy and (time.monotonic() - checked_at) * 1000 < settings.health_ttl_ms
+
+    def _record_health(self, healthy: bool) -> None:
+        """Store the result of a health check."""
+        with self._health_lock:
+            self._last_health = (time.monotonic(), healthy)
+
+
+@lru_cache(maxsize=32)
+def get_vector_store_service(collection_name: str | None = None) -> VectorStoreService:
+    """Get cached VectorStoreService instance for a collection.
+
+    Args:
+        collection_name: Name of the Qdrant collection (default from settings)
+
+    Returns:
+        Shared VectorStoreService instance
+    """
+    return VectorStoreService(collection_name)
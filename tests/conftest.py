@@ -1,7 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -50,6 +50,7 @@ def mock_qdrant_client():
     with patch("app.core.vector_store.get_qdrant_client") as mock:
         client = MagicMock()
         client.get_collections.return_value = MagicMock(collections=[])
+        client.collection_exists.return_value = True
         client.get_collection.return_value = MagicMock(
             points_count=10,
             vectors_count=10,
@@ -59,23 +60,52 @@ def mock_qdrant_client():
         yield client
 
 
+@pytest.fixture
+def mock_async_qdrant_client():
+    """Mock async Qdrant client."""
+    with patch("app.core.vector_store.get_async_qdrant_client") as mock:
+        client = AsyncMock()
+        client.get_collections.return_value = MagicMock(collections=[])
+        client.query_points.return_value = MagicMock(points=[])
+        # upload_points is a blocking method even on the async client
+        client.upload_points = MagicMock()
+        mock.return_value = client
+        yield client
+
+
 @pytest.fixture
 def mock_embeddings():
     """Mock OpenAI embeddings."""
+    from app.core.embeddings import cached_embed_query
+
+    cached_embed_query.cache_clear()
     with patch("app.core.embeddings.get_embeddings") as mock:
         embeddings = MagicMock()
         embeddings.embed_query.return_value = [0.1] * 1536
         embeddings.embed_documents.return_value = [[0.1] * 1536]
         mock.return_value = embeddings
         yield embeddings
+    cached_embed_query.cache_clear()
 
 
 @pytest.fixture
 def mock_vector_store(mock_qdrant_client, mock_embeddings):
     """Mock vector store service."""
-    with patch("app.core.vector_store.VectorStoreService") as mock:
+    from app.core.vector_store import get_vector_store_service
+
+    # Routes import the factory at module load, so patch their names too and
+    # keep the real lru_cache from holding a service across tests
+    get_vector_store_service.cache_clear()
+    with (
+        patch("app.core.vector_store.VectorStoreService") as mock,
+        patch("app.core.vector_store.get_vector_store_service") as mock_factory,
+        patch("app.api.routes.health.get_vector_store_service", mock_factory),
+        patch("app.api.routes.documents.get_vector_store_service", mock_factory),
+        patch("app.core.rag_chain.get_vector_store_service", mock_factory),
+    ):
         service = MagicMock()
         service.health_check.return_value = True
+        service.ahealth_check = AsyncMock(return_value=True)
         service.get_collection_info.return_value = {
             "name": "test_collection",
             "points_count": 10,
@@ -83,9 +113,14 @@ def mock_vector_store(mock_qdrant_client, mock_embeddings):
             "status": "green",
         }
         service.add_documents.return_value = ["id1", "id2"]
+        service.aadd_documents = AsyncMock(return_value=["id1", "id2"])
         service.search.return_value = []
+        service.asearch = AsyncMock(return_value=[])
+        service.asearch_with_scores = AsyncMock(return_value=[])
         mock.return_value = service
+        mock_factory.return_value = service
         yield service
+    get_vector_store_service.cache_clear()
 
 
 @pytest.fixture
@@ -32,6 +32,14 @@ class TestHealthEndpoints:
         assert data["qdrant_connected"] is True
         assert "collection_info" in data
 
+    def test_readiness_check_unhealthy(self, client, mock_vector_store):
+        """Test readiness check reports 503 when the vector store is unhealthy."""
+        mock_vector_store.ahealth_check.return_value = False
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+
     def test_docs_available(self, client):
         """Test that Swagger docs are available."""
         response = client.get("/docs")
@@ -44,3 +52,14 @@ class TestHealthEndpoints:
         data = response.json()
         assert "openapi" in data
         assert "paths" in data
+
+    def test_responses_use_orjson(self, client):
+        """Test that API responses are serialized with ORJSONResponse."""
+        from fastapi.responses import ORJSONResponse
+
+        from app.main import app
+
+        response = client.get("/health")
+
+        assert response.headers["content-type"] == "application/json"
+        assert app.router.default_response_class is ORJSONResponse
@@ -154,7 +154,7 @@ class TestQueryEndpoints:
         from langchain_core.documents import Document
 
         # Configure mock to return search results
-        mock_vector_store.search_with_scores.return_value = [
+        mock_vector_store.asearch_with_scores.return_value = [
             (
                 Document(
                     page_content="RAG content",
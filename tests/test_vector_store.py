@@ -0,0 +1,511 @@
+"""Tests for vector store service."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+
+def make_point(point_id: str, content: str, score: float = 0.9) -> MagicMock:
+    """Build a mock Qdrant scored point with LangChain's payload layout."""
+    return MagicMock(id=point_id, score=score, payload={"page_content": content, "metadata": {}})
+
+
+@pytest.fixture
+def vector_store_service(mock_qdrant_client, mock_async_qdrant_client, mock_embeddings):
+    """Create a VectorStoreService backed by mocked Qdrant and embeddings."""
+    with patch("app.core.vector_store.get_embeddings", return_value=mock_embeddings):
+        from app.core.vector_store import VectorStoreService
+
+        yield VectorStoreService("test_collection")
+
+
+class TestAddDocuments:
+    """Test document ingestion."""
+
+    def test_add_documents_empty(self, vector_store_service, mock_qdrant_client):
+        """Test that adding no documents makes no requests."""
+        assert vector_store_service.add_documents([]) == []
+        mock_qdrant_client.upload_points.assert_not_called()
+
+    def test_add_documents_batches_requests(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that documents are embedded in batches and uploaded without waiting."""
+        documents = [
+            Document(page_content=f"chunk {i}", metadata={"source": "test.txt", "chunk": i})
+            for i in range(5)
+        ]
+        mock_embeddings.embed_documents.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
+
+        with patch("app.core.vector_store.settings.embed_batch_size", 2):
+            ids = vector_store_service.add_documents(documents)
+            kwargs = mock_qdrant_client.upload_points.call_args.kwargs
+            points = list(kwargs["points"])
+
+        assert len(ids) == 5
+        assert kwargs["wait"] is False
+        assert kwargs["parallel"] == 1
+        assert mock_embeddings.embed_documents.call_count == 3
+        assert [p.id for p in points] == ids
+        assert points[0].payload == {
+            "page_content": "chunk 0",
+            "metadata": {"source": "test.txt", "chunk": 0},
+        }
+
+    def test_add_documents_uploads_in_parallel(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that ingests spanning several upload batches use worker processes."""
+        documents = [Document(page_content=f"chunk {i}") for i in range(100)]
+
+        with patch("app.core.vector_store.settings.qdrant_upload_parallel", 4):
+            vector_store_service.add_documents(documents)
+
+        kwargs = mock_qdrant_client.upload_points.call_args.kwargs
+        assert kwargs["batch_size"] == 64
+        assert kwargs["parallel"] == 4
+
+
+class TestSearchCache:
+    """Test search result caching."""
+
+    def test_repeated_query_served_from_cache(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that an identical query skips embedding and Qdrant."""
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[make_point("p1", "RAG")])
+
+        first = vector_store_service.search("What is RAG?")
+        second = vector_store_service.search("What is RAG?")
+
+        assert first == second
+        assert mock_qdrant_client.query_points.call_count == 1
+        assert mock_embeddings.embed_query.call_count == 1
+
+    def test_similar_query_served_from_semantic_cache(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that a query with a near-identical embedding reuses results."""
+        mock_qdrant_client.query_points.return_value = MagicMock(
+            points=[make_point("p1", "cached")]
+        )
+
+        vector_store_service.search("What is RAG?")
+        results = vector_store_service.search("what is rag")
+
+        assert results[0].page_content == "cached"
+        assert mock_qdrant_client.query_points.call_count == 1
+        assert mock_embeddings.embed_query.call_count == 2
+
+    def test_dissimilar_query_misses_cache(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that an unrelated query goes to Qdrant."""
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+        mock_embeddings.embed_query.side_effect = [[1.0, 0.0], [0.0, 1.0]]
+
+        vector_store_service.search("What is RAG?")
+        vector_store_service.search("Something else entirely")
+
+        assert mock_qdrant_client.query_points.call_count == 2
+
+    def test_concurrent_searches_share_cache_safely(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that searches from several threads do not corrupt the caches."""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        rng = np.random.default_rng(0)
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+        mock_embeddings.embed_query.side_effect = lambda text: rng.standard_normal(64).tolist()
+
+        def run(worker: int) -> None:
+            for i in range(600):
+                vector_store_service.search(f"query {worker}-{i % 50}")
+                if i % 40 == 0:
+                    vector_store_service.clear_search_cache()
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for future in [pool.submit(run, worker) for worker in range(8)]:
+                    future.result()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_add_documents_clears_cache(self, vector_store_service, mock_qdrant_client):
+        """Test that ingesting documents invalidates cached results."""
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+        vector_store_service.search("What is RAG?")
+        vector_store_service.add_documents([Document(page_content="new", metadata={})])
+        vector_store_service.search("What is RAG?")
+
+        assert mock_qdrant_client.query_points.call_count == 2
+
+
+class TestQueryEmbeddingCache:
+    """Test query embedding reuse."""
+
+    def test_search_with_scores_reuses_query_embedding(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that repeated scored searches embed the query only once."""
+        mock_qdrant_client.query_points.return_value = MagicMock(
+            points=[make_point("p1", "RAG", score=0.75)]
+        )
+
+        results = vector_store_service.search_with_scores("What is RAG?")
+        vector_store_service.search_with_scores("What is RAG?")
+        vector_store_service.search("What is RAG?")
+
+        assert results[0][0].page_content == "RAG"
+        assert results[0][1] == 0.75
+        assert mock_qdrant_client.query_points.call_count == 3
+        assert mock_embeddings.embed_query.call_count == 1
+
+    def test_embed_query_reused_by_search_by_vector(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that a caller-held query vector can be searched without re-embedding."""
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+        embedding = vector_store_service.embed_query("What is RAG?")
+        vector_store_service.search_by_vector(embedding, k=2)
+        vector_store_service.search("What is RAG?", k=2)
+
+        assert embedding.dtype == np.float32
+        assert not embedding.flags.writeable
+        assert mock_embeddings.embed_query.call_count == 1
+        kwargs = mock_qdrant_client.query_points.call_args.kwargs
+        np.testing.assert_array_equal(kwargs["query"], embedding)
+        assert kwargs["limit"] == 2
+
+
+class TestAsyncMethods:
+    """Test async vector store operations."""
+
+    async def test_asearch_uses_async_client(
+        self, vector_store_service, mock_async_qdrant_client, mock_embeddings
+    ):
+        """Test that async search queries Qdrant through the async client."""
+        mock_async_qdrant_client.query_points.return_value = MagicMock(
+            points=[make_point("p1", "RAG")]
+        )
+
+        results = await vector_store_service.asearch("What is RAG?")
+        cached = await vector_store_service.asearch("What is RAG?")
+
+        assert results[0].page_content == "RAG"
+        assert results[0].metadata["_id"] == "p1"
+        assert cached == results
+        mock_async_qdrant_client.query_points.assert_awaited_once()
+
+    async def test_async_searches_share_embedding_cache(
+        self, vector_store_service, mock_async_qdrant_client, mock_embeddings
+    ):
+        """Test that async searches reuse the per-process query embedding cache."""
+        vector_store_service.embed_query("What is RAG?")
+
+        await vector_store_service.asearch("What is RAG?")
+        await vector_store_service.asearch_with_scores("What is RAG?")
+        await vector_store_service.asearch_with_scores("What is RAG?")
+
+        assert mock_embeddings.embed_query.call_count == 1
+        query = mock_async_qdrant_client.query_points.call_args.kwargs["query"]
+        assert query.dtype == np.float32
+
+    async def test_aadd_documents(
+        self, vector_store_service, mock_async_qdrant_client, mock_embeddings
+    ):
+        """Test that async ingestion uploads through upload_points and waits for it."""
+        mock_embeddings.aembed_documents = AsyncMock(return_value=[[0.1] * 1536])
+
+        ids = await vector_store_service.aadd_documents([Document(page_content="new")])
+
+        assert len(ids) == 1
+        mock_embeddings.embed_documents.assert_not_called()
+        mock_async_qdrant_client.upsert.assert_not_called()
+        kwargs = mock_async_qdrant_client.upload_points.call_args.kwargs
+        assert [point.id for point in kwargs["points"]] == ids
+        assert kwargs["parallel"] == 1
+        assert kwargs["wait"] is True
+
+    async def test_ahealth_check(self, vector_store_service, mock_async_qdrant_client):
+        """Test async health check."""
+        mock_async_qdrant_client.get_collections.side_effect = Exception("down")
+        assert await vector_store_service.ahealth_check() is False
+
+        mock_async_qdrant_client.get_collections.side_effect = None
+        assert await vector_store_service.ahealth_check() is True
+
+
+class TestCollectionInfo:
+    """Test collection probing and info caching."""
+
+    def test_init_fetches_collection_once(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that construction and info lookups share one get_collection call."""
+        info = vector_store_service.get_collection_info()
+
+        assert info["points_count"] == 10
+        assert info["status"] == "green"
+        mock_qdrant_client.get_collection.assert_called_once_with("test_collection")
+        mock_qdrant_client.collection_exists.assert_not_called()
+        mock_embeddings.embed_documents.assert_not_called()
+
+    def test_collection_info_not_found(self, vector_store_service, mock_qdrant_client):
+        """Test that a missing collection is reported without calling get_collection."""
+        mock_qdrant_client.collection_exists.return_value = False
+        vector_store_service._collection_info = None
+
+        info = vector_store_service.get_collection_info()
+
+        assert info["status"] == "not_found"
+        assert info["points_count"] == 0
+        mock_qdrant_client.get_collection.assert_called_once()
+
+    def test_collection_info_refetched_after_ingest(self, vector_store_service, mock_qdrant_client):
+        """Test that ingesting documents invalidates cached collection info."""
+        vector_store_service.add_documents([Document(page_content="new", metadata={})])
+        vector_store_service.get_collection_info()
+
+        assert mock_qdrant_client.get_collection.call_count == 2
+
+
+class TestServiceFactory:
+    """Test the cached service factory."""
+
+    def test_factory_reuses_instance(self, mock_qdrant_client, mock_async_qdrant_client):
+        """Test that the factory initializes each collection only once."""
+        from app.core.vector_store import get_vector_store_service
+
+        get_vector_store_service.cache_clear()
+        first = get_vector_store_service("test_collection")
+        second = get_vector_store_service("test_collection")
+        get_vector_store_service.cache_clear()
+
+        assert first is second
+        mock_qdrant_client.get_collection.assert_called_once()
+
+
+class TestGenerateIds:
+    """Test point ID generation."""
+
+    def test_generate_ids_are_unique_uuid4(self):
+        """Test that generated IDs are distinct, hyphenated version 4 UUIDs."""
+        from uuid import UUID
+
+        from app.core.vector_store import _generate_ids
+
+        ids = _generate_ids(100)
+
+        assert len(set(ids)) == 100
+        assert all(str(UUID(point_id)) == point_id for point_id in ids)
+        assert all(UUID(point_id).version == 4 for point_id in ids)
+
+
+class TestSearchMany:
+    """Test batched multi-query search."""
+
+    def test_search_many_single_request(
+        self, vector_store_service, mock_qdrant_client, mock_embeddings
+    ):
+        """Test that several queries are embedded and searched in one request each."""
+        mock_embeddings.embed_documents.return_value = [[0.1] * 1536, [0.2] * 1536]
+        mock_qdrant_client.query_batch_points.return_value = [
+            MagicMock(points=[make_point("p1", "RAG")]),
+            MagicMock(points=[]),
+        ]
+
+        results = vector_store_service.search_many(["What is RAG?", "What is Qdrant?"], k=2)
+
+        assert [len(docs) for docs in results] == [1, 0]
+        assert results[0][0].page_content == "RAG"
+        mock_embeddings.embed_documents.assert_called_once()
+        requests = mock_qdrant_client.query_batch_points.call_args.kwargs["requests"]
+        assert [request.limit for request in requests] == [2, 2]
+
+    def test_search_many_empty(self, vector_store_service, mock_qdrant_client):
+        """Test that no queries makes no requests."""
+        assert vector_store_service.search_many([]) == []
+        mock_qdrant_client.query_batch_points.assert_not_called()
+
+
+class TestCollectionCreation:
+    """Test collection creation."""
+
+    def test_creates_quantized_collection(
+        self, mock_qdrant_client, mock_async_qdrant_client, mock_embeddings
+    ):
+        """Test that a missing collection is created with quantization and payload indexes."""
+        from httpx import Headers
+        from qdrant_client.http.exceptions import UnexpectedResponse
+
+        from app.core.vector_store import VectorStoreService
+
+        mock_qdrant_client.get_collection.side_effect = [
+            UnexpectedResponse(404, "Not Found", b"", Headers()),
+            mock_qdrant_client.get_collection.return_value,
+        ]
+
+        with patch("app.core.vector_store.get_embeddings", return_value=mock_embeddings):
+            VectorStoreService("test_collection")
+
+        kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+        assert kwargs["collection_name"] == "test_collection"
+        assert kwargs["quantization_config"].scalar.type == "int8"
+        assert kwargs["hnsw_config"].m == 16
+        assert kwargs["on_disk_payload"] is True
+        mock_qdrant_client.create_payload_index.assert_called_once_with(
+            collection_name="test_collection",
+            field_name="metadata.source",
+            field_schema="keyword",
+        )
+
+    def test_grpc_not_found_creates_collection(
+        self, mock_qdrant_client, mock_async_qdrant_client, mock_embeddings
+    ):
+        """Test that a gRPC NOT_FOUND on startup is treated as a missing collection."""
+        import grpc
+
+        from app.core.vector_store import VectorStoreService
+
+        not_found = grpc.RpcError()
+        not_found.code = lambda: grpc.StatusCode.NOT_FOUND
+        mock_qdrant_client.get_collection.side_effect = [
+            not_found,
+            mock_qdrant_client.get_collection.return_value,
+        ]
+
+        with patch("app.core.vector_store.get_embeddings", return_value=mock_embeddings):
+            VectorStoreService("test_collection")
+
+        mock_qdrant_client.create_collection.assert_called_once()
+        mock_qdrant_client.collection_exists.assert_not_called()
+
+    def test_invalid_payload_index_schema_rejected(self):
+        """Test that an unknown payload index schema fails settings validation."""
+        from pydantic import ValidationError
+
+        from app.config import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(payload_indexes={"metadata.source": "not-a-schema"})
+
+
+class TestHealthCheck:
+    """Test health check caching."""
+
+    def test_successful_health_check_is_cached(self, vector_store_service, mock_qdrant_client):
+        """Test that a recent success skips the Qdrant request."""
+        assert vector_store_service.health_check() is True
+        assert vector_store_service.health_check() is True
+
+        mock_qdrant_client.get_collections.assert_called_once()
+
+    def test_failed_health_check_is_not_cached(self, vector_store_service, mock_qdrant_client):
+        """Test that failures are re-checked on the next call."""
+        mock_qdrant_client.get_collections.side_effect = Exception("down")
+        assert vector_store_service.health_check() is False
+
+        mock_qdrant_client.get_collections.side_effect = None
+        assert vector_store_service.health_check() is True
+        assert mock_qdrant_client.get_collections.call_count == 2
+
+    def test_health_check_expires(self, vector_store_service, mock_qdrant_client):
+        """Test that a cached success expires after the TTL."""
+        with patch("app.core.vector_store.settings.health_ttl_ms", 0):
+            vector_store_service.health_check()
+            vector_store_service.health_check()
+
+        assert mock_qdrant_client.get_collections.call_count == 2
+
+
+class TestResolveVectorName:
+    """Test vector field name detection."""
+
+    def test_named_vectors_use_first_name(self):
+        """Test that the first named vector is used."""
+        from qdrant_client.http.models import Distance, VectorParams
+
+        from app.core.vector_store import VectorStoreService
+
+        params = VectorParams(size=1536, distance=Distance.COSINE)
+        info = MagicMock()
+        info.config.params.vectors = {"dense": params, "other": params}
+
+        assert VectorStoreService._resolve_vector_name(info) == "dense"
+
+    def test_unnamed_vector_uses_default(self):
+        """Test that a single unnamed vector resolves to the default name."""
+        from qdrant_client.http.models import Distance, VectorParams
+
+        from app.core.vector_store import VectorStoreService
+
+        info = MagicMock()
+        info.config.params.vectors = VectorParams(size=1536, distance=Distance.COSINE)
+
+        assert VectorStoreService._resolve_vector_name(info) == ""
+        assert VectorStoreService._resolve_vector_name(None) == ""
+
+
+class TestPageContentCompression:
+    """Test compressed page content storage."""
+
+    def test_compressed_payload_round_trip(self, vector_store_service, mock_qdrant_client):
+        """Test that compressed content is stored under its own key and read back."""
+        from app.core.vector_store import _document_from_point
+
+        document = Document(page_content="RAG " * 200, metadata={"source": "test.txt"})
+
+        with patch("app.core.vector_store.settings.compress_page_content", True):
+            vector_store_service.add_documents([document])
+            point = next(iter(mock_qdrant_client.upload_points.call_args.kwargs["points"]))
+
+        assert "page_content" not in point.payload
+        assert len(point.payload["page_content_zstd"]) < len(document.page_content)
+
+        restored = _document_from_point(point, "test_collection")
+        assert restored.page_content == document.page_content
+        assert restored.metadata["source"] == "test.txt"
+
+    def test_plain_payload_still_readable(self):
+        """Test that points stored without compression are still decoded."""
+        from app.core.vector_store import _document_from_point
+
+        document = _document_from_point(make_point("p1", "plain text"), "test_collection")
+
+        assert document.page_content == "plain text"
+
+
+class TestRetriever:
+    """Test the service-backed retriever."""
+
+    def test_retriever_uses_service_search(self, vector_store_service, mock_qdrant_client):
+        """Test that the retriever goes through the service's cached search."""
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[make_point("p1", "RAG")])
+        retriever = vector_store_service.get_retriever(k=3)
+
+        first = retriever.invoke("What is RAG?")
+        second = retriever.invoke("What is RAG?")
+
+        assert first[0].page_content == "RAG"
+        assert second == first
+        mock_qdrant_client.query_points.assert_called_once()
+        assert mock_qdrant_client.query_points.call_args.kwargs["limit"] == 3
+
+    async def test_retriever_async(self, vector_store_service, mock_async_qdrant_client):
+        """Test that async retrieval uses the async client."""
+        mock_async_qdrant_client.query_points.return_value = MagicMock(
+            points=[make_point("p1", "RAG")]
+        )
+
+        documents = await vector_store_service.get_retriever().ainvoke("What is RAG?")
+
+        assert documents[0].page_content == "RAG"